@@ -0,0 +1,25 @@
+"""Optional build hook compiling the color mapper with mypyc.
+
+All project metadata lives in pyproject.toml; this file only adds the compiled
+extension when asked to. ``pipeline.py`` is plain integer arithmetic on 8-bit
+channels, so mypyc turns it into native code without any API change:
+
+    LEDLIGHT_USE_MYPYC=1 pip install --no-build-isolation .
+
+mypy must already be installed in the build environment. Without the variable the
+package installs as pure Python.
+"""
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("LEDLIGHT_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only the mapper is compiled; errors in the modules it imports are not its concern.
+    ext_modules = mypycify(["--follow-imports=silent", "src/ledlight_controller/pipeline.py"])
+
+setup(ext_modules=ext_modules)
@@ -2,17 +2,34 @@
 from __future__ import annotations
 
 import logging
+import os
+import select
 import subprocess
-import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import Any, Protocol
 
-from .image_analysis import ImageAnalysisError, analyse_image
+import cv2  # type: ignore[import]
+import numpy as np
+
+from .image_analysis import DEFAULT_ROI_FRACTION, ImageAnalysisError, analyse_array
 from .models import LightMeasurement
 
 _LOGGER = logging.getLogger(__name__)
 
+# Low-latency demuxer options for OpenCV's FFmpeg backend: TCP transport, no input
+# buffering and minimal stream probing so the first frame arrives without delay.
+_FFMPEG_CAPTURE_OPTIONS = "rtsp_transport;tcp|fflags;nobuffer|flags;low_delay|probesize;32|analyzeduration;0"
+_RECONNECT_DELAY_S = 1.0
+
+# Output size for ffmpeg frames; only the average is consumed, so full resolution is wasted.
+# The area filter averages every source pixel into the thumbnail. Analysing all of it
+# (``stride=1, roi_fraction=1.0``) therefore gives the full-frame mean to within 8-bit
+# quantisation; on a 1920x1080 stream each thumbnail pixel is an exact 30x30 block.
+FRAME_WIDTH = 64
+FRAME_HEIGHT = 36
+
 
 class CameraReader(ABC):
     """Abstract camera reader that yields light measurements."""
@@ -22,6 +39,9 @@ class CameraReader(ABC):
         """Return a single daylight measurement from the camera feed."""
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release any stream or device held by the reader; the default holds none."""
+
 
 class FrameExtractor(Protocol):
     """Callable protocol extracting a measurement from a BGR frame."""
@@ -42,55 +62,249 @@ class OpenCVCameraReader(CameraReader):
         raise NotImplementedError("Integrate cv2.VideoCapture and extractor pipeline")
 
 
-def capture_snapshot(rtsp_url: str, destination: Path, timeout_s: float) -> None:
-    """Capture a single frame using ffmpeg and store it at *destination*."""
+def _raw_frame_command(rtsp_url: str, video_filter: str) -> tuple[str, ...]:
+    """Build an ffmpeg argv that decodes *rtsp_url* into raw ``bgr24`` frames on stdout."""
 
-    cmd = [
+    # Skip input buffering and stream probing so ffmpeg emits the first decodable frame
+    # instead of waiting to analyse the stream. The trade-off is that the frame may be
+    # slightly older or less refined than one taken after a full probe, which does not
+    # matter for an average-light measurement.
+    return (
         "ffmpeg",
         "-hide_banner",
         "-loglevel",
         "error",
         "-rtsp_transport",
         "tcp",
+        "-fflags",
+        "nobuffer",
+        "-flags",
+        "low_delay",
+        "-probesize",
+        "32",
+        "-analyzeduration",
+        "0",
+        "-use_wallclock_as_timestamps",
+        "1",
         "-i",
         rtsp_url,
-        "-frames:v",
-        "1",
-        "-y",
-        str(destination),
-    ]
-    _LOGGER.debug("Executing capture command: %s", " ".join(cmd))
-    subprocess.run(cmd, check=True, timeout=timeout_s)
+        "-an",
+        "-sn",
+        "-vf",
+        video_filter,
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "bgr24",
+        "pipe:1",
+    )
+
+
+class FfmpegFrameStream:
+    """Long-lived ffmpeg process that emits one raw BGR frame per interval.
+
+    Keeping a single process (and RTSP session) open avoids spawning ffmpeg and
+    renegotiating the stream on every capture. ffmpeg's ``fps`` filter paces the
+    output, so :meth:`read_frame` simply blocks until the next frame arrives. The
+    process is (re)started lazily whenever it is missing, exits or stalls.
+    """
+
+    def __init__(
+        self,
+        *,
+        rtsp_url: str,
+        interval_s: float,
+        timeout_s: float = 10.0,
+        width: int = FRAME_WIDTH,
+        height: int = FRAME_HEIGHT,
+    ) -> None:
+        if not rtsp_url:
+            raise ValueError("rtsp_url must be provided for frame streaming")
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        self._cmd = _raw_frame_command(rtsp_url, f"fps=1/{interval_s:g},scale={width}:{height}:flags=area")
+        # A frame is due every interval; allow timeout_s on top for (re)connecting.
+        self._read_timeout_s = interval_s + timeout_s
+        self._shape = (height, width, 3)
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Starting frame stream: %s", " ".join(self._cmd))
+        # Unbuffered so ``readinto`` returns whatever is available after ``select``.
+        return subprocess.Popen(self._cmd, stdout=subprocess.PIPE, bufsize=0)
+
+    def read_frame(self) -> np.ndarray:
+        """Block until ffmpeg delivers the next frame and return it as a BGR array.
+
+        Raises ``RuntimeError`` if ffmpeg exits or no complete frame arrives in time;
+        the process is then discarded and restarted on the next call.
+        """
+
+        if self._process is None:
+            self._process = self._start()
+        stdout = self._process.stdout
+        assert stdout is not None
+
+        frame = np.empty(self._shape, dtype=np.uint8)
+        view = memoryview(frame).cast("B")
+        deadline = time.monotonic() + self._read_timeout_s
+        received = 0
+        while received < len(view):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([stdout], [], [], remaining)[0]:
+                self.close()
+                raise RuntimeError(f"No frame received from ffmpeg within {self._read_timeout_s:.1f}s")
+            count = stdout.readinto(view[received:])
+            if not count:
+                self.close()
+                raise RuntimeError("ffmpeg frame stream ended unexpectedly")
+            received += count
+        return frame
+
+    def close(self) -> None:
+        """Terminate the ffmpeg process if it is running."""
+
+        process, self._process = self._process, None
+        if process is None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=5.0)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+
+    def __enter__(self) -> FfmpegFrameStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 class FfmpegSnapshotCameraReader(CameraReader):
-    """Camera reader that samples frames from an RTSP stream via ffmpeg."""
+    """Camera reader that keeps a persistent RTSP session open via OpenCV's FFmpeg backend.
+
+    A daemon thread decodes the stream continuously and keeps only the newest frame,
+    so a capture never waits for the next keyframe to arrive. Frames are decoded into
+    two reusable buffers: the pump fills the back buffer while captures read the front
+    one, and the two are swapped under the lock once a frame is complete.
+    """
 
-    def __init__(self, *, rtsp_url: str, timeout_s: float = 10.0) -> None:
+    def __init__(
+        self,
+        *,
+        rtsp_url: str,
+        timeout_s: float = 10.0,
+        roi_fraction: float = DEFAULT_ROI_FRACTION,
+    ) -> None:
         if not rtsp_url:
             raise ValueError("rtsp_url must be provided for snapshot capture")
         self._rtsp_url = rtsp_url
         self._timeout_s = timeout_s
+        self._roi_fraction = roi_fraction
+        self._frames: list[np.ndarray | None] = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+        self._first_frame = threading.Event()
+        self._stop = threading.Event()
+        # The pump opens the stream itself, so an offline camera at start-up is retried
+        # in the background instead of failing construction.
+        self._thread = threading.Thread(
+            target=self._pump,
+            name="rtsp-frame-pump",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _open_capture(self) -> cv2.VideoCapture:
+        # The FFmpeg backend only reads its demuxer options from the environment, and
+        # only when the stream is opened. Respect any options the operator already set.
+        os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", _FFMPEG_CAPTURE_OPTIONS)
+        timeout_ms = int(self._timeout_s * 1000)
+        capture = cv2.VideoCapture(
+            self._rtsp_url,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, timeout_ms, cv2.CAP_PROP_READ_TIMEOUT_MSEC, timeout_ms],
+        )
+        if not capture.isOpened():
+            capture.release()
+            raise RuntimeError("Failed to open RTSP stream via OpenCV/FFmpeg")
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return capture
+
+    def _pump(self) -> None:
+        """Open the stream and decode frames until stopped, reconnecting whenever it drops."""
+
+        capture: cv2.VideoCapture | None = None
+        while not self._stop.is_set():
+            if capture is None:
+                try:
+                    capture = self._open_capture()
+                except RuntimeError as exc:
+                    _LOGGER.warning("Opening RTSP stream failed: %s", exc)
+                    self._stop.wait(_RECONNECT_DELAY_S)
+                    continue
+
+            if not capture.grab():
+                _LOGGER.warning("Lost RTSP stream; reconnecting")
+                capture.release()
+                capture = None
+                # Never serve a frame from before the outage.
+                with self._lock:
+                    self._first_frame.clear()
+                continue
+
+            # Only this thread moves ``_front``, so reading it without the lock is safe.
+            back = 1 - self._front
+            ok, frame = capture.retrieve(self._frames[back])
+            if ok and frame is not None:
+                # OpenCV decodes in place when the buffer matches; keep whatever it returned
+                # so a resolution change simply replaces the buffer.
+                self._frames[back] = frame
+                with self._lock:
+                    self._front = back
+                    self._first_frame.set()
+
+        if capture is not None:
+            capture.release()
 
     def capture_measurement(self) -> LightMeasurement:
-        """Capture a snapshot, analyse it, and return the resulting measurement."""
+        """Analyse the most recently decoded frame and return the resulting measurement."""
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as handle:
-            snapshot_path = Path(handle.name)
+        if self._stop.is_set():
+            raise RuntimeError("Camera reader has been closed")
+        if not self._first_frame.wait(self._timeout_s):
+            raise RuntimeError(f"No frame received from RTSP stream within {self._timeout_s:.1f}s")
+        # Hold the lock while analysing: the pump never writes the front buffer and
+        # cannot swap it out until the analysis is done.
+        with self._lock:
+            frame = self._frames[self._front]
+            if not self._first_frame.is_set() or frame is None:
+                raise RuntimeError("RTSP stream dropped before a frame could be read")
+            try:
+                stats = analyse_array(frame, roi_fraction=self._roi_fraction)
+            except ImageAnalysisError as exc:
+                raise RuntimeError("Failed to analyse captured frame") from exc
+        _LOGGER.debug(
+            "Frame measurement lux=%.2f normalized=%.3f",
+            stats.measurement.lux,
+            stats.measurement.normalized or 0.0,
+        )
+        return stats.measurement
 
-        try:
-            capture_snapshot(self._rtsp_url, snapshot_path, self._timeout_s)
-            stats = analyse_image(snapshot_path)
-            _LOGGER.debug(
-                "Snapshot measurement lux=%.2f normalized=%.3f",
-                stats.measurement.lux,
-                stats.measurement.normalized or 0.0,
-            )
-            return stats.measurement
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
-            raise RuntimeError("Failed to capture snapshot via ffmpeg") from exc
-        except ImageAnalysisError as exc:
-            raise RuntimeError("Failed to analyse captured snapshot") from exc
-        finally:
-            if snapshot_path.exists():
-                snapshot_path.unlink()
+    def close(self) -> None:
+        """Stop the decoder thread and release the RTSP session."""
+
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            # A blocked grab() returns at the latest after the read timeout.
+            self._thread.join(self._timeout_s + 1.0)
+
+    def __enter__(self) -> FfmpegSnapshotCameraReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
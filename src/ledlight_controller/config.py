@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Mapping, Optional
+from typing import Callable, Mapping, Optional
 
 from .models import ColorRGB
 from .settings_loader import get_section, load_settings
@@ -24,6 +24,7 @@ class CameraConfig:
     frame_rate: Optional[int] = None
     rtsp_url: Optional[str] = None
     snapshot_timeout_s: float = 10.0
+    roi_fraction: float = 1.0
 
 
 @dataclass
@@ -39,6 +40,7 @@ class LampConfig:
     device_id: Optional[str] = None
     local_key: Optional[str] = None
     version: str = "3.3"
+    min_color_delta: int = 0
 
 
 @dataclass
@@ -63,6 +65,7 @@ class TapoCaptureConfig:
     interval_seconds: float = 20.0
     timeout_seconds: float = 10.0
     rtsp_url: Optional[str] = None
+    roi_fraction: float = 1.0
 
 
 @dataclass
@@ -106,6 +109,16 @@ def _parse_tapo_capture(settings: Mapping[str, Mapping[str, object]]) -> TapoCap
     elif rtsp_value is not None:
         _LOGGER.warning("Invalid rtsp_url '%s'; ignoring entry", rtsp_value)
 
+    roi_value = section.get("roi_fraction")
+    if isinstance(roi_value, (int, float)) and 0.0 < float(roi_value) <= 1.0:
+        config.roi_fraction = float(roi_value)
+    elif roi_value is not None:
+        _LOGGER.warning(
+            "Invalid roi_fraction '%s'; using %.2f",
+            roi_value,
+            config.roi_fraction,
+        )
+
     return config
 
 
@@ -134,44 +147,53 @@ def _parse_lamp(settings: Mapping[str, Mapping[str, object]]) -> LampConfig:
         config.address = address_value.strip()
         config.host = address_value.strip()
 
+    delta_value = section.get("min_color_delta")
+    if isinstance(delta_value, int) and delta_value >= 0:
+        config.min_color_delta = delta_value
+    elif delta_value is not None:
+        _LOGGER.warning(
+            "Invalid lamp.min_color_delta '%s'; using %d",
+            delta_value,
+            config.min_color_delta,
+        )
+
     return config
 
 
+def _non_negative(value: float) -> float:
+    return max(0.0, value)
+
+
+# Numeric mapper keys with an optional clamp applied to valid values.
+_MAPPER_FLOAT_FIELDS: tuple[tuple[str, Callable[[float], float] | None], ...] = (
+    ("dark_lux", None),
+    ("bright_lux", None),
+    ("min_brightness", _non_negative),
+    ("max_brightness", _non_negative),
+    ("min_saturation", _non_negative),
+    ("max_saturation", _non_negative),
+    ("dark_brightness", _non_negative),
+)
+_MAPPER_BOOL_FIELDS: tuple[str, ...] = ("use_camera_average",)
+
+
 def _parse_mapper(settings: Mapping[str, Mapping[str, object]]) -> MapperSettings:
     config = MapperSettings()
     section = get_section(settings, "mapper")
 
-    dark_value = section.get("dark_lux")
-    if isinstance(dark_value, (int, float)):
-        config.dark_lux = float(dark_value)
-    elif dark_value is not None:
-        _LOGGER.warning("Invalid mapper.dark_lux '%s'; using %.1f", dark_value, config.dark_lux)
-
-    bright_value = section.get("bright_lux")
-    if isinstance(bright_value, (int, float)):
-        config.bright_lux = float(bright_value)
-    elif bright_value is not None:
-        _LOGGER.warning("Invalid mapper.bright_lux '%s'; using %.1f", bright_value, config.bright_lux)
-
-    min_brightness_value = section.get("min_brightness")
-    if isinstance(min_brightness_value, (int, float)):
-        config.min_brightness = max(0.0, float(min_brightness_value))
-    elif min_brightness_value is not None:
-        _LOGGER.warning(
-            "Invalid mapper.min_brightness '%s'; using %.1f",
-            min_brightness_value,
-            config.min_brightness,
-        )
+    for key, clamp in _MAPPER_FLOAT_FIELDS:
+        value = section.get(key)
+        if isinstance(value, (int, float)):
+            setattr(config, key, clamp(float(value)) if clamp else float(value))
+        elif value is not None:
+            _LOGGER.warning("Invalid mapper.%s '%s'; using %.1f", key, value, getattr(config, key))
 
-    max_brightness_value = section.get("max_brightness")
-    if isinstance(max_brightness_value, (int, float)):
-        config.max_brightness = max(0.0, float(max_brightness_value))
-    elif max_brightness_value is not None:
-        _LOGGER.warning(
-            "Invalid mapper.max_brightness '%s'; using %.1f",
-            max_brightness_value,
-            config.max_brightness,
-        )
+    for key in _MAPPER_BOOL_FIELDS:
+        value = section.get(key)
+        if isinstance(value, bool):
+            setattr(config, key, value)
+        elif value is not None:
+            _LOGGER.warning("Invalid mapper.%s '%s'; using %s", key, value, getattr(config, key))
 
     if config.bright_lux <= config.dark_lux:
         adjusted = config.dark_lux + 1.0
@@ -191,32 +213,6 @@ def _parse_mapper(settings: Mapping[str, Mapping[str, object]]) -> MapperSetting
         )
         config.max_brightness = config.min_brightness
 
-    use_camera_value = section.get("use_camera_average")
-    if isinstance(use_camera_value, bool):
-        config.use_camera_average = use_camera_value
-    elif use_camera_value is not None:
-        _LOGGER.warning("Invalid mapper.use_camera_average '%s'; using %s", use_camera_value, config.use_camera_average)
-
-    min_sat_value = section.get("min_saturation")
-    if isinstance(min_sat_value, (int, float)):
-        config.min_saturation = max(0.0, float(min_sat_value))
-    elif min_sat_value is not None:
-        _LOGGER.warning(
-            "Invalid mapper.min_saturation '%s'; using %.1f",
-            min_sat_value,
-            config.min_saturation,
-        )
-
-    max_sat_value = section.get("max_saturation")
-    if isinstance(max_sat_value, (int, float)):
-        config.max_saturation = max(0.0, float(max_sat_value))
-    elif max_sat_value is not None:
-        _LOGGER.warning(
-            "Invalid mapper.max_saturation '%s'; using %.1f",
-            max_sat_value,
-            config.max_saturation,
-        )
-
     if config.max_saturation < config.min_saturation:
         _LOGGER.warning(
             "mapper.max_saturation %.1f lower than mapper.min_saturation %.1f; matching minimum",
@@ -225,16 +221,6 @@ def _parse_mapper(settings: Mapping[str, Mapping[str, object]]) -> MapperSetting
         )
         config.max_saturation = config.min_saturation
 
-    dark_brightness_value = section.get("dark_brightness")
-    if isinstance(dark_brightness_value, (int, float)):
-        config.dark_brightness = max(0.0, float(dark_brightness_value))
-    elif dark_brightness_value is not None:
-        _LOGGER.warning(
-            "Invalid mapper.dark_brightness '%s'; using %.1f",
-            dark_brightness_value,
-            config.dark_brightness,
-        )
-
     red_value = section.get("dark_color_red")
     green_value = section.get("dark_color_green")
     blue_value = section.get("dark_color_blue")
@@ -285,6 +271,7 @@ def load_app_config(settings_path: Path | None = None) -> AppConfig:
     camera_config = CameraConfig(
         rtsp_url=capture_config.rtsp_url,
         snapshot_timeout_s=capture_config.timeout_seconds,
+        roi_fraction=capture_config.roi_fraction,
     )
 
     return AppConfig(
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 
 from .models import ColorRGB, LampColorCommand
@@ -21,6 +22,9 @@ class LampController(ABC):
         """Helper to send a plain RGB color at full brightness and saturation."""
         self.apply_state(LampColorCommand(color=color, brightness=255, saturation=255))
 
+    def close(self) -> None:
+        """Release any connection held by the controller; the default holds none."""
+
 
 class YeelightController(LampController):
     """Placeholder Wi-Fi lamp implementation using a Yeelight-like API."""
@@ -37,7 +41,14 @@ class YeelightController(LampController):
 
 
 class TuyaBulbController(LampController):
-    """Lamp controller using the local Tuya (tinytuya) protocol."""
+    """Lamp controller using the local Tuya (tinytuya) protocol.
+
+    A daemon thread probes the bulb once and then sends periodic heartbeats, rebuilding
+    the device when the socket drops, so neither the ``status()`` probe nor a reconnect
+    normally ends up on the colour update path. A failed probe is retried by the next
+    heartbeat or colour update, whichever comes first. Each heartbeat also re-asserts
+    ``turn_on`` once the controller has switched the lamp on.
+    """
 
     def __init__(
         self,
@@ -48,6 +59,8 @@ class TuyaBulbController(LampController):
         version: str = "3.3",
         persist_session: bool = True,
         connection_timeout_s: float = 4.0,
+        min_color_delta: int = 0,
+        heartbeat_s: float = 25.0,
     ) -> None:
         self._device_id = device_id
         self._address = address
@@ -55,7 +68,24 @@ class TuyaBulbController(LampController):
         self._version = version
         self._persist_session = persist_session
         self._connection_timeout_s = connection_timeout_s
+        self._min_color_delta = min_color_delta
+        self._heartbeat_s = heartbeat_s
         self._device = self._build_device()
+        # Whether the current device has answered a ``status()`` probe.
+        self._probed = False
+        # Last state confirmed by the bulb, used to skip redundant round-trips.
+        self._last_on: bool | None = None
+        self._last_mode: str | None = None
+        self._last_color: tuple[int, int, int] | None = None
+        # Serialises socket use between colour updates and the keepalive thread.
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive,
+            name="tuya-keepalive",
+            daemon=True,
+        )
+        self._keepalive_thread.start()
 
     def _build_device(self):  # type: ignore[no-untyped-def]
         try:
@@ -77,28 +107,126 @@ class TuyaBulbController(LampController):
         bulb.set_socketTimeout(self._connection_timeout_s)
         return bulb
 
-    def apply_state(self, command: LampColorCommand) -> None:
-        """Send a full color command (RGB + brightness/saturation) to the Tuya bulb."""
-        bulb = self._device
+    def _keepalive(self) -> None:
+        """Probe the bulb, then heartbeat it every ``heartbeat_s`` until closed."""
+        with self._lock:
+            if not self._probed and not self._stop.is_set():
+                self._probe()
+        while not self._stop.wait(self._heartbeat_s):
+            with self._lock:
+                try:
+                    self._heartbeat()
+                except Exception as exc:  # noqa: BLE001
+                    # Never let one bad round-trip end the keepalive for good.
+                    _LOGGER.exception("Tuya bulb %s keepalive failed: %s", self._device_id, exc)
+
+    def _probe(self) -> None:
+        """Fetch the bulb status so tinytuya learns its DPS layout (``bulb_configured``)."""
+        try:
+            result = self._device.status()
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("Tuya bulb %s status probe failed: %s", self._device_id, exc)
+            return
+        if isinstance(result, dict) and "Err" in result:
+            _LOGGER.warning("Tuya bulb %s status probe failed: %s", self._device_id, result)
+            return
+        self._probed = True
+
+    def _heartbeat(self) -> None:
         try:
-            _LOGGER.debug(
-                "Setting Tuya bulb %s at %s to RGB(%d,%d,%d) brightness=%d saturation=%d",
-                self._device_id,
-                self._address,
-                command.color.red,
-                command.color.green,
-                command.color.blue,
-                command.brightness,
-                command.saturation,
-            )
-            if not getattr(bulb, "bulb_configured", False):
-                bulb.status()
-            bulb.turn_on()
-            bulb.set_mode("colour")
-            bulb.set_colour(command.color.red, command.color.green, command.color.blue)
+            result = self._device.heartbeat()
         except Exception as exc:  # noqa: BLE001
-            _LOGGER.exception("Failed to update Tuya bulb: %s", exc)
-            raise
+            _LOGGER.warning("Tuya bulb %s heartbeat failed (%s); reconnecting", self._device_id, exc)
+        else:
+            # tinytuya reports most socket failures as an error payload rather than raising.
+            if not (isinstance(result, dict) and "Err" in result):
+                if not self._probed:
+                    self._probe()
+                if self._last_on:
+                    # The cache cannot see the lamp being switched off from the app or at the
+                    # wall, so keep asserting the state this controller last set.
+                    self._check_acknowledged("turn_on", self._device.turn_on())
+                return
+            _LOGGER.warning("Tuya bulb %s heartbeat failed (%s); reconnecting", self._device_id, result)
+
+        try:
+            self._device.close()
+        except Exception:  # noqa: BLE001
+            pass
+        self._device = self._build_device()
+        self._probed = False
+        self._reset_state_cache()
+        self._probe()
+
+    def apply_state(self, command: LampColorCommand) -> None:
+        """Send a full color command (RGB + brightness/saturation) to the Tuya bulb.
+
+        Commands whose RGB is within ``min_color_delta`` (summed absolute channel
+        difference) of the last colour sent are dropped to spare the network; the
+        default of 0 sends every change. Brightness is carried in the RGB values and
+        is not compared separately.
+        """
+        color = (command.color.red, command.color.green, command.color.blue)
+        with self._lock:
+            if self._last_color is not None:
+                delta = (
+                    abs(color[0] - self._last_color[0])
+                    + abs(color[1] - self._last_color[1])
+                    + abs(color[2] - self._last_color[2])
+                )
+                if delta < self._min_color_delta:
+                    _LOGGER.debug("Suppressed apply_state for Tuya bulb %s (delta=%d)", self._device_id, delta)
+                    return
+
+            if not self._probed:
+                # The keepalive has not managed to probe yet; try once more before writing.
+                self._probe()
+            bulb = self._device
+            try:
+                _LOGGER.debug(
+                    "Setting Tuya bulb %s at %s to RGB(%d,%d,%d) brightness=%d saturation=%d",
+                    self._device_id,
+                    self._address,
+                    command.color.red,
+                    command.color.green,
+                    command.color.blue,
+                    command.brightness,
+                    command.saturation,
+                )
+                # Cache each step only once the bulb has acknowledged it, so a failed write
+                # is resent in full rather than suppressed by the debounce above.
+                if not self._last_on:
+                    self._check_acknowledged("turn_on", bulb.turn_on())
+                    self._last_on = True
+                if self._last_mode != "colour":
+                    self._check_acknowledged("set_mode", bulb.set_mode("colour"))
+                    self._last_mode = "colour"
+                if color != self._last_color:
+                    self._check_acknowledged("set_colour", bulb.set_colour(*color))
+                    self._last_color = color
+            except Exception as exc:  # noqa: BLE001
+                # The bulb's real state is unknown now; resend everything next time.
+                self._reset_state_cache()
+                _LOGGER.exception("Failed to update Tuya bulb: %s", exc)
+                raise
+
+    def _check_acknowledged(self, action: str, result: object) -> None:
+        """Raise ``RuntimeError`` if the bulb rejected a call, dropping the state cache first."""
+        # tinytuya reports most socket failures as an error payload rather than raising.
+        if isinstance(result, dict) and "Err" in result:
+            self._reset_state_cache()
+            raise RuntimeError(f"Tuya bulb {self._device_id} rejected {action}: {result}")
+
+    def _reset_state_cache(self) -> None:
+        self._last_on = None
+        self._last_mode = None
+        self._last_color = None
+
+    def close(self) -> None:
+        """Stop the keepalive thread and close the bulb socket."""
+        self._stop.set()
+        with self._lock:
+            self._device.close()
 
     # Backwards compatibility for older callers
     def apply_color(self, color: ColorRGB) -> None:  # type: ignore[override]
@@ -26,6 +26,7 @@ def _build_lamp_controller(app_config: AppConfig) -> TuyaBulbController:
         address=address,
         local_key=lamp_config.local_key,
         version=lamp_config.version,
+        min_color_delta=lamp_config.min_color_delta,
     )
 
 
@@ -43,6 +44,7 @@ def build_default_app(
     camera = FfmpegSnapshotCameraReader(
         rtsp_url=app_config.camera.rtsp_url,
         timeout_s=app_config.camera.snapshot_timeout_s,
+        roi_fraction=app_config.camera.roi_fraction,
     )
     mapper_settings = app_config.mapper
     mapper_config = PipelineMapperConfig(
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorRGB:
     """Simple RGB color representation using 0-255 channel values."""
 
@@ -13,7 +13,7 @@ class ColorRGB:
     blue: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LightMeasurement:
     """Scalar light intensity measurement with optional normalized value."""
 
@@ -23,7 +23,7 @@ class LightMeasurement:
     dominant_channel: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LampColorCommand:
     """Full color command for the lamp, including intensity controls."""
 
@@ -1,41 +1,48 @@
 """Core logic for translating daylight measurements into lamp colors."""
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import operator
 from dataclasses import dataclass
 
-from typing import Tuple
-from colorsys import rgb_to_hsv
+from typing import Any, Protocol, Tuple
 
 from .models import ColorRGB, LampColorCommand, LightMeasurement
 
+# Reads all three channels of a ColorRGB in one C-level call.
+_RGB_GETTER = operator.attrgetter("red", "green", "blue")
 
-class ColorMapper(ABC):
-    """Abstract mapper turning light measurements into RGB colors."""
 
-    @abstractmethod
+class ColorMapper(Protocol):
+    """Structural interface for mappers turning light measurements into RGB colors."""
+
     def map_measurement(self, measurement: LightMeasurement) -> LampColorCommand:
         """Convert a measurement to a lamp command."""
-        raise NotImplementedError
+        ...
 
 
-def _clamp(value: float, min_value: float, max_value: float) -> float:
-    return max(min_value, min(max_value, value))
+def _to_level(value: float) -> int:
+    """Round a non-negative level half up; negative values become 0."""
+    return int(value + 0.5) if value > 0 else 0
 
 
-def _blend(a: float, b: float, factor: float) -> float:
-    return a + (b - a) * factor
+def _to_u8(value: float) -> int:
+    """Round *value* half up and clamp it to the 0-255 range of a color channel."""
+    rounded = _to_level(value)
+    return 255 if rounded > 255 else rounded
 
 
-def _blend_color(color_a: ColorRGB, color_b: ColorRGB, factor: float) -> Tuple[float, float, float]:
+def _blend_color(color_a: ColorRGB, color_b: ColorRGB, n8: int) -> Tuple[int, int, int]:
+    """Blend two colors at the 8-bit position *n8*, rounding in integer space."""
+    ar, ag, ab = _RGB_GETTER(color_a)
+    br, bg, bb = _RGB_GETTER(color_b)
     return (
-        _blend(color_a.red, color_b.red, factor),
-        _blend(color_a.green, color_b.green, factor),
-        _blend(color_a.blue, color_b.blue, factor),
+        ar + ((br - ar) * n8 + 127) // 255,
+        ag + ((bg - ag) * n8 + 127) // 255,
+        ab + ((bb - ab) * n8 + 127) // 255,
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MapperConfig:
     warm_color: ColorRGB = ColorRGB(255, 160, 64)
     cool_color: ColorRGB = ColorRGB(255, 255, 235)
@@ -50,57 +57,107 @@ class MapperConfig:
     dark_brightness: float = 12.0
 
 
-class DefaultColorMapper(ColorMapper):
+class DefaultColorMapper:
     """Mapping daylight measurements to lamp commands with configurable strategy."""
 
     def __init__(self, config: MapperConfig | None = None) -> None:
         self._config = config or MapperConfig()
+        # The config is frozen, so derived values are computed once here rather than
+        # re-read from the dataclass on every measurement.
+        c = self._config
+        self._dark_lux = c.dark_lux
+        self._bright_lux = c.bright_lux
+        self._lux_range = max(c.bright_lux - c.dark_lux, 1e-6)
+        self._use_camera_average = c.use_camera_average
+        self._warm_color = c.warm_color
+        self._cool_color = c.cool_color
+        self._dark_color = c.dark_color
+        # Brightness, saturation and channels are all 8-bit on the wire, so the limits
+        # are rounded once and everything downstream stays in integer arithmetic.
+        # Brightness limits are not capped here: a level above 255 still scales the
+        # color up before the channels and the command are clamped.
+        self._min_brightness = _to_level(c.min_brightness)
+        self._brightness_span = _to_level(c.max_brightness) - self._min_brightness
+        self._dark_brightness = _to_level(max(c.min_brightness, c.dark_brightness))
+        self._min_saturation = _to_u8(c.min_saturation)
+        self._max_saturation = _to_u8(c.max_saturation)
+        # Lamp color, brightness and blend source for each 8-bit step of the normalized
+        # daylight level. Only the warm/cool blend is independent of the measurement, so
+        # it is the one path that can be tabulated up front.
+        self._blend_table = tuple(self._blend_entry(n8) for n8 in range(256))
+
+    def _blend_entry(self, n8: int) -> Tuple[ColorRGB, int, ColorRGB]:
+        brightness = self._min_brightness + (self._brightness_span * n8 + 127) // 255
+        red, green, blue = _blend_color(self._warm_color, self._cool_color, n8)
+        source = ColorRGB(red=red, green=green, blue=blue)
+        rgb_color = ColorRGB(
+            red=_to_u8((red * brightness + 127) // 255),
+            green=_to_u8((green * brightness + 127) // 255),
+            blue=_to_u8((blue * brightness + 127) // 255),
+        )
+        return rgb_color, brightness, source
+
+    def map_image(self, image_bgr: Any) -> LampColorCommand:
+        """Analyse an in-memory BGR frame and convert it to a lamp command.
+
+        The frame is reduced to its average color and luminance in a single vectorised
+        pass before the scalar mapping runs, so no per-pixel work happens in Python.
+        """
+        # Imported lazily so the mapper itself does not require OpenCV.
+        from .image_analysis import analyse_array
+
+        return self.map_measurement(analyse_array(image_bgr).measurement)
 
     def map_measurement(self, measurement: LightMeasurement) -> LampColorCommand:
         """Convert a measurement to a lamp command using configured strategy."""
+        # Each field is read once; the dataclass slots are descriptor lookups.
         normalized = measurement.normalized
         lux_value = measurement.lux
+        average_color = measurement.average_color
         if lux_value is None and normalized is not None:
-            lux_value = normalized * self._config.bright_lux
+            lux_value = normalized * self._bright_lux
         if lux_value is None:
-            lux_value = self._config.dark_lux
+            lux_value = self._dark_lux
 
-        lux_range = max(self._config.bright_lux - self._config.dark_lux, 1e-6)
-        adjusted = (lux_value - self._config.dark_lux) / lux_range
-        normalized = _clamp(adjusted, 0.0, 1.0)
-        brightness = _blend(self._config.min_brightness, self._config.max_brightness, normalized)
-        scale = brightness / 255.0
+        # The clamps below are inlined on purpose: this runs every tick and the helper
+        # calls cost more than the arithmetic itself. The daylight level is quantised to
+        # 8 bits up front so the rest of the mapping is integer arithmetic.
+        normalized = (lux_value - self._dark_lux) / self._lux_range
+        n8 = 0 if normalized <= 0.0 else (255 if normalized >= 1.0 else int(normalized * 255.0 + 0.5))
 
         if normalized <= 0.0:
-            rgb_color = self._config.dark_color
-            brightness = max(brightness, self._config.dark_brightness)
+            rgb_color = self._dark_color
+            brightness = self._dark_brightness
             source = rgb_color
+        elif not self._use_camera_average or average_color is None:
+            rgb_color, brightness, source = self._blend_table[n8]
         else:
-            if self._config.use_camera_average and measurement.average_color is not None:
-                source = measurement.average_color
-            else:
-                blended = _blend_color(self._config.warm_color, self._config.cool_color, normalized)
-                source = ColorRGB(
-                    red=int(round(_clamp(blended[0], 0.0, 255.0))),
-                    green=int(round(_clamp(blended[1], 0.0, 255.0))),
-                    blue=int(round(_clamp(blended[2], 0.0, 255.0))),
-                )
-
-            red = int(round(_clamp(source.red * scale, 0.0, 255.0)))
-            green = int(round(_clamp(source.green * scale, 0.0, 255.0)))
-            blue = int(round(_clamp(source.blue * scale, 0.0, 255.0)))
-            rgb_color = ColorRGB(red=red, green=green, blue=blue)
-
-        sat_source = measurement.average_color if measurement.average_color is not None else source
-        r_norm = sat_source.red / 255.0
-        g_norm = sat_source.green / 255.0
-        b_norm = sat_source.blue / 255.0
-        _, saturation, _ = rgb_to_hsv(r_norm, g_norm, b_norm)
-        saturation_value = _clamp(saturation * 255.0, self._config.min_saturation, self._config.max_saturation)
-
-        brightness_value = int(round(_clamp(brightness, 0.0, 255.0)))
+            brightness = self._min_brightness + (self._brightness_span * n8 + 127) // 255
+            source = average_color
+            red = (source.red * brightness + 127) // 255
+            green = (source.green * brightness + 127) // 255
+            blue = (source.blue * brightness + 127) // 255
+            rgb_color = ColorRGB(
+                red=0 if red < 0 else (255 if red > 255 else red),
+                green=0 if green < 0 else (255 if green > 255 else green),
+                blue=0 if blue < 0 else (255 if blue > 255 else blue),
+            )
+
+        # HSV saturation (max - min) / max on the 0-255 channels, rounded in integer space.
+        sat_source = average_color if average_color is not None else source
+        channels = _RGB_GETTER(sat_source)
+        channel_max = max(channels)
+        channel_min = min(channels)
+        saturation = (
+            0 if channel_max == 0 else ((channel_max - channel_min) * 255 + channel_max // 2) // channel_max
+        )
+        if saturation > self._max_saturation:
+            saturation = self._max_saturation
+        if saturation < self._min_saturation:
+            saturation = self._min_saturation
+
         return LampColorCommand(
             color=rgb_color,
-            brightness=brightness_value,
-            saturation=int(round(_clamp(saturation_value, 0.0, 255.0))),
+            brightness=0 if brightness < 0 else (255 if brightness > 255 else brightness),
+            saturation=saturation,
         )
@@ -3,60 +3,103 @@ from __future__ import annotations
 
 import argparse
 import logging
-import subprocess
 import sys
-import tempfile
 import time
 from pathlib import Path
 
-from ..camera_client import capture_snapshot
+from ..camera_client import FfmpegFrameStream, FfmpegSnapshotCameraReader
 from ..config import DEFAULT_SETTINGS_PATH, TapoCaptureConfig, load_tapo_capture_config
-from ..image_analysis import ImageAnalysisError, analyse_image
+from ..image_analysis import DEFAULT_ROI_FRACTION, ImageAnalysisError, analyse_array
+from ..models import ColorRGB, LightMeasurement
+from ..settings_loader import SettingsError
 _LOGGER = logging.getLogger(__name__)
 
-def capture_loop(rtsp_url: str, interval_s: float, timeout_s: float) -> None:
-    """Continuously pull frames on an interval and remove temporary files."""
+_BACKENDS = ("opencv", "ffmpeg")
+
+
+def capture_loop(
+    rtsp_url: str,
+    interval_s: float,
+    timeout_s: float,
+    *,
+    backend: str = "opencv",
+    roi_fraction: float = DEFAULT_ROI_FRACTION,
+) -> None:
+    """Continuously pull frames on an interval and log their light statistics.
+
+    The ``opencv`` backend decodes the stream in-process and keeps the newest frame
+    ready; ``ffmpeg`` pipes paced raw frames from a long-lived ffmpeg process.
+    """
     _LOGGER.info(
-        "Starting capture loop against %s (interval %.1fs)",
+        "Starting capture loop against %s (interval %.1fs, %s backend)",
         rtsp_url,
         interval_s,
+        backend,
     )
-    while True:
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as handle:
-            snapshot_path = Path(handle.name)
-        try:
-            capture_snapshot(rtsp_url, snapshot_path, timeout_s)
-            size_kb = snapshot_path.stat().st_size / 1024
-            _LOGGER.debug("Snapshot saved at %s (%.1f KiB)", snapshot_path, size_kb)
-            _log_image_statistics(snapshot_path)
-        except subprocess.CalledProcessError as exc:
-            _LOGGER.error("ffmpeg failed with exit code %s", exc.returncode)
-        except subprocess.TimeoutExpired:
-            _LOGGER.error("ffmpeg timed out after %.1f seconds", timeout_s)
-        except RuntimeError as exc:
-            _LOGGER.error("Snapshot capture failed: %s", exc)
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.exception("Unexpected error while capturing snapshot: %s", exc)
-        finally:
-            if snapshot_path.exists():
-                snapshot_path.unlink()
-        time.sleep(interval_s)
-
-
-def _log_image_statistics(image_path: Path) -> None:
-    """Analyse the captured image and emit summary statistics."""
-    try:
-        stats = analyse_image(image_path)
-    except ImageAnalysisError as exc:
-        _LOGGER.error("Failed to analyse %s: %s", image_path, exc)
-        return
-
-    measurement = stats.measurement
+    if backend == "ffmpeg":
+        _ffmpeg_capture_loop(rtsp_url, interval_s, timeout_s, roi_fraction)
+    else:
+        _opencv_capture_loop(rtsp_url, interval_s, timeout_s, roi_fraction)
+
+
+def _opencv_capture_loop(rtsp_url: str, interval_s: float, timeout_s: float, roi_fraction: float) -> None:
+    """Sample the in-process decoder's latest frame on fixed monotonic deadlines."""
+    # The reader connects and reconnects in the background; captures fail until it is up.
+    with FfmpegSnapshotCameraReader(rtsp_url=rtsp_url, timeout_s=timeout_s, roi_fraction=roi_fraction) as reader:
+        next_tick = time.monotonic()
+        while True:
+            try:
+                _log_measurement(reader.capture_measurement())
+            except RuntimeError as exc:
+                _LOGGER.error("Frame capture failed: %s", exc)
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.exception("Unexpected error while capturing frame: %s", exc)
+
+            next_tick += interval_s
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind after a stall; restart the cadence instead of bursting.
+                next_tick = time.monotonic()
+
+
+def _ffmpeg_capture_loop(rtsp_url: str, interval_s: float, timeout_s: float, roi_fraction: float) -> None:
+    """Analyse the frames a persistent ffmpeg process emits once per interval."""
+    # One ffmpeg process stays connected and paces the frames itself, so the loop
+    # only has to wait for the next one.
+    with FfmpegFrameStream(rtsp_url=rtsp_url, interval_s=interval_s, timeout_s=timeout_s) as stream:
+        while True:
+            try:
+                frame = stream.read_frame()
+            except OSError as exc:
+                _LOGGER.error("Failed to start ffmpeg: %s", exc)
+            except RuntimeError as exc:
+                _LOGGER.error("Frame capture failed: %s", exc)
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.exception("Unexpected error while capturing frame: %s", exc)
+            else:
+                _LOGGER.debug("Frame captured (%dx%d)", frame.shape[1], frame.shape[0])
+                try:
+                    # The frame is already an area-averaged thumbnail; use every pixel. A
+                    # centred crop of it covers the same share of the camera image.
+                    stats = analyse_array(frame, stride=1, roi_fraction=roi_fraction)
+                except ImageAnalysisError as exc:
+                    _LOGGER.error("Failed to analyse snapshot: %s", exc)
+                else:
+                    _log_measurement(stats.measurement)
+                continue
+            # The stream restarts on the next read; back off so a dead camera is not hammered.
+            time.sleep(interval_s)
+
+
+def _log_measurement(measurement: LightMeasurement) -> None:
+    """Emit summary statistics for a frame measurement."""
     normalized = measurement.normalized
     if normalized is None:
         normalized = measurement.lux / 255.0 if measurement.lux is not None else 0.0
 
-    avg_color = stats.average_color
+    avg_color = measurement.average_color or ColorRGB(0, 0, 0)
     _LOGGER.info(
         "Light measurement lux=%.2f normalized=%.3f avg_rgb=(%d,%d,%d) dominant=%s",
         measurement.lux,
@@ -64,7 +107,7 @@ def _log_image_statistics(image_path: Path) -> None:
         avg_color.red,
         avg_color.green,
         avg_color.blue,
-        stats.dominant_channel,
+        measurement.dominant_channel,
     )
 
 
@@ -91,7 +134,13 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         "--timeout",
         type=float,
-        help="Seconds before ffmpeg times out; overrides settings file when provided",
+        help="Seconds to wait for the stream or a frame before giving up; overrides settings file when provided",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=_BACKENDS,
+        default="opencv",
+        help="Decode in-process with OpenCV (default) or pipe frames from an ffmpeg process",
     )
     parser.add_argument(
         "--settings-path",
@@ -106,7 +155,11 @@ def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv or sys.argv[1:])
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     settings_path = (args.settings_path or DEFAULT_SETTINGS_PATH).expanduser()
-    capture_config = _load_capture_config(settings_path)
+    try:
+        capture_config = _load_capture_config(settings_path)
+    except SettingsError as exc:
+        _LOGGER.error("%s", exc)
+        return 1
 
     interval = args.interval if args.interval is not None else capture_config.interval_seconds
     timeout = args.timeout if args.timeout is not None else capture_config.timeout_seconds
@@ -119,7 +172,13 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 1
 
-    capture_loop(rtsp_url, interval_s=interval, timeout_s=timeout)
+    capture_loop(
+        rtsp_url,
+        interval_s=interval,
+        timeout_s=timeout,
+        backend=args.backend,
+        roi_fraction=capture_config.roi_fraction,
+    )
     return 0
 
 
@@ -8,6 +8,7 @@ from pathlib import Path
 from ..config import DEFAULT_SETTINGS_PATH, LampConfig, load_lamp_config
 from ..light_client import TuyaBulbController
 from ..models import ColorRGB
+from ..settings_loader import SettingsError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,11 +18,12 @@ def _parse_rgb(args: argparse.Namespace) -> ColorRGB:
         hex_value = args.hex.lstrip("#")
         if len(hex_value) != 6:
             raise ValueError("Hex colour must be 6 characters like FF8800")
-        return ColorRGB(
-            red=int(hex_value[0:2], 16),
-            green=int(hex_value[2:4], 16),
-            blue=int(hex_value[4:6], 16),
-        )
+        try:
+            red, green, blue = bytes.fromhex(hex_value)
+        except ValueError as exc:
+            # fromhex skips whitespace, so a 6-character value may still decode short.
+            raise ValueError(f"Hex colour {args.hex!r} is not valid hexadecimal like FF8800") from exc
+        return ColorRGB(red=red, green=green, blue=blue)
 
     if args.rgb:
         red, green, blue = args.rgb
@@ -73,7 +75,11 @@ def main(argv: list[str] | None = None) -> int:
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(asctime)s %(levelname)s %(message)s")
 
     settings_path = (args.settings_path or DEFAULT_SETTINGS_PATH).expanduser()
-    config = load_lamp_config(settings_path)
+    try:
+        config = load_lamp_config(settings_path)
+    except SettingsError as exc:
+        _LOGGER.error("%s", exc)
+        return 1
     try:
         rgb = _parse_rgb(args)
     except ValueError as exc:
@@ -87,7 +93,11 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     _LOGGER.info("Applying colour RGB(%d,%d,%d)", rgb.red, rgb.green, rgb.blue)
-    controller.apply_color(rgb)
+    try:
+        controller.apply_color(rgb)
+    except RuntimeError:
+        # The controller has already logged why the bulb refused the update.
+        return 1
     return 0
 
 
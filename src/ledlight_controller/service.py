@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 import time
 from typing import Callable
 
 from .camera_client import CameraReader
 from .config import AppConfig
 from .light_client import LampController
+from .models import LampColorCommand
 from .pipeline import ColorMapper
 
 _LOGGER = logging.getLogger(__name__)
 
+# How often the lamp thread re-checks that the capture thread is still alive.
+_QUEUE_POLL_S = 0.5
+
 StopCondition = Callable[[], bool]
 
 
@@ -34,50 +40,142 @@ class DaylightSyncService:
         self._stop_condition = stop_condition or (lambda: False)
 
     def run(self) -> None:
-        """Run the synchronization loop until the stop condition triggers."""
+        """Run the synchronization loop until the stop condition triggers.
+
+        Capturing and mapping happen on a producer thread that hands lamp commands to
+        this thread through a single-slot queue, so the next frame is grabbed while the
+        previous command is still being sent to the lamp. If the lamp falls behind, the
+        unsent command is replaced by the newest one.
+
+        The stop condition is called on the capture thread, not the caller's, once
+        before every capture (failed ones included); it therefore needs no locking as
+        long as nothing else calls it. The loop ends once the last command has been
+        sent, and the camera reader and the lamp are closed on the way out.
+        """
         _LOGGER.info("Starting daylight synchronization loop")
-        while not self._stop_condition():
+        pending: queue.Queue[LampColorCommand] = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce,
+            args=(pending, stop),
+            name="daylight-capture",
+            daemon=True,
+        )
+        producer.start()
+        try:
+            while True:
+                command = _next_command(pending, producer)
+                if command is None:
+                    # The producer sets ``stop`` when the stop condition ends the run.
+                    if not stop.is_set():
+                        _LOGGER.error("Capture thread exited unexpectedly")
+                    break
+                try:
+                    self._lamp.apply_state(command)
+                except Exception as exc:  # noqa: BLE001
+                    _LOGGER.exception("Lamp update failed: %s", exc)
+        finally:
+            stop.set()
+            producer.join()
+            self._close()
+        _LOGGER.info("Daylight synchronization loop stopped")
+
+    def _close(self) -> None:
+        """Close the camera reader and the lamp once neither thread can use them."""
+        for name, resource in (("camera", self._camera), ("lamp", self._lamp)):
             try:
-                measurement = self._camera.capture_measurement()
-                lux_value = measurement.lux if measurement.lux is not None else 0.0
-                raw_normalized = measurement.normalized
-                if raw_normalized is None:
-                    raw_normalized = lux_value / 255.0 if lux_value else 0.0
-
-                mapper_settings = self._config.mapper
-                lux_range = max(mapper_settings.bright_lux - mapper_settings.dark_lux, 1e-6)
-                mapped_normalized = (lux_value - mapper_settings.dark_lux) / lux_range
-                mapped_normalized = max(0.0, min(1.0, mapped_normalized))
-                target_brightness = (
-                    mapper_settings.min_brightness
-                    + (mapper_settings.max_brightness - mapper_settings.min_brightness) * mapped_normalized
-                )
-
-                command = self._mapper.map_measurement(measurement)
-                target_brightness = command.brightness
-
-                average_color = measurement.average_color
-                average_color_str = (
-                    f"({average_color.red},{average_color.green},{average_color.blue})"
-                    if average_color is not None
-                    else "(n/a)"
-                )
-
-                _LOGGER.info(
-                    "Measurement lux=%.2f raw_norm=%.3f avg_rgb=%s dominant=%s mapped_norm=%.3f target_brightness=%d saturation=%d -> lamp RGB(%d,%d,%d)",
-                    lux_value,
-                    raw_normalized,
-                    average_color_str,
-                    measurement.dominant_channel or "n/a",
-                    mapped_normalized,
-                    target_brightness,
-                    command.saturation,
-                    command.color.red,
-                    command.color.green,
-                    command.color.blue,
-                )
-                self._lamp.apply_state(command)
+                resource.close()
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.exception("Closing the %s failed: %s", name, exc)
+
+    def _produce(self, pending: queue.Queue[LampColorCommand], stop: threading.Event) -> None:
+        """Capture and map measurements every interval until *stop* is set.
+
+        Captures are scheduled against fixed monotonic deadlines, so the time spent
+        capturing does not stretch the configured interval.
+        """
+        interval_s = self._config.capture_interval_s
+        next_tick = time.monotonic()
+        while not stop.is_set():
+            if self._stop_condition():
+                stop.set()
+                break
+            try:
+                command = self._capture_command()
             except Exception as exc:  # noqa: BLE001
                 _LOGGER.exception("Daylight sync iteration failed: %s", exc)
-            time.sleep(self._config.capture_interval_s)
-        _LOGGER.info("Daylight synchronization loop stopped")
+            else:
+                _offer_latest(pending, command)
+
+            next_tick += interval_s
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                stop.wait(delay)
+            else:
+                # Fell behind after a stall; restart the cadence instead of bursting.
+                next_tick = time.monotonic()
+
+    def _capture_command(self) -> LampColorCommand:
+        """Capture one measurement and map it to a lamp command."""
+        measurement = self._camera.capture_measurement()
+        command = self._mapper.map_measurement(measurement)
+
+        if _LOGGER.isEnabledFor(logging.INFO):
+            lux_value = measurement.lux if measurement.lux is not None else 0.0
+            raw_normalized = measurement.normalized
+            if raw_normalized is None:
+                raw_normalized = lux_value / 255.0 if lux_value else 0.0
+
+            average_color = measurement.average_color
+            color = command.color
+            average_color_str = (
+                f"({average_color.red},{average_color.green},{average_color.blue})"
+                if average_color is not None
+                else "(n/a)"
+            )
+
+            _LOGGER.info(
+                "Measurement lux=%.2f raw_norm=%.3f avg_rgb=%s dominant=%s target_brightness=%d saturation=%d -> lamp RGB(%d,%d,%d)",
+                lux_value,
+                raw_normalized,
+                average_color_str,
+                measurement.dominant_channel or "n/a",
+                command.brightness,
+                command.saturation,
+                color.red,
+                color.green,
+                color.blue,
+            )
+        return command
+
+
+def _offer_latest(pending: queue.Queue[LampColorCommand], command: LampColorCommand) -> None:
+    """Queue *command*, evicting an older command the lamp has not picked up yet."""
+    try:
+        pending.put_nowait(command)
+    except queue.Full:
+        try:
+            pending.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            _LOGGER.debug("Lamp update still pending; replacing it with the newest command")
+        # Only the producer puts, so the slot is guaranteed to be free now.
+        pending.put_nowait(command)
+
+
+def _next_command(
+    pending: queue.Queue[LampColorCommand],
+    producer: threading.Thread,
+) -> LampColorCommand | None:
+    """Block until a command is available, or return ``None`` once the producer is gone."""
+    while True:
+        try:
+            return pending.get(timeout=_QUEUE_POLL_S)
+        except queue.Empty:
+            if not producer.is_alive():
+                # The producer may have queued a last command just before exiting.
+                try:
+                    return pending.get_nowait()
+                except queue.Empty:
+                    return None
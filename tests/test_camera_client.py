@@ -0,0 +1,144 @@
+"""Tests for the background RTSP reader against a fake cv2.VideoCapture."""
+from __future__ import annotations
+
+import queue
+import time
+from typing import Any, Callable, Iterator
+
+import numpy as np
+import pytest
+
+from ledlight_controller import camera_client
+from ledlight_controller.camera_client import FfmpegSnapshotCameraReader
+
+# Queued in place of a frame to make the next grab() fail, as a dropped stream does.
+_DROP = object()
+
+
+def _frame(level: int) -> np.ndarray:
+    return np.full((36, 64, 3), level, dtype=np.uint8)
+
+
+class _FakeStream:
+    """Scripted RTSP stream shared by every capture the reader opens."""
+
+    def __init__(self) -> None:
+        self.items: queue.Queue[Any] = queue.Queue()
+        self.captures: list[_FakeCapture] = []
+
+    def open(self, *args: Any) -> _FakeCapture:
+        capture = _FakeCapture(self)
+        self.captures.append(capture)
+        return capture
+
+
+class _FakeCapture:
+    """Stands in for ``cv2.VideoCapture``, decoding in place like OpenCV does."""
+
+    def __init__(self, stream: _FakeStream) -> None:
+        self._stream = stream
+        self._pending: np.ndarray | None = None
+        self.released = False
+
+    def isOpened(self) -> bool:
+        return True
+
+    def set(self, prop: int, value: float) -> bool:
+        return True
+
+    def release(self) -> None:
+        self.released = True
+
+    def grab(self) -> bool:
+        try:
+            item = self._stream.items.get(timeout=0.02)
+        except queue.Empty:
+            # Nothing new yet; the following retrieve() reports no frame.
+            self._pending = None
+            return True
+        if item is _DROP:
+            return False
+        self._pending = item
+        return True
+
+    def retrieve(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray | None]:
+        frame, self._pending = self._pending, None
+        if frame is None:
+            return False, None
+        if image is not None and image.shape == frame.shape:
+            image[...] = frame
+            return True, image
+        return True, frame.copy()
+
+
+def _wait_for(condition: Callable[[], bool], timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        time.sleep(0.01)
+
+
+def _front_level(reader: FfmpegSnapshotCameraReader) -> int | None:
+    frame = reader._frames[reader._front]
+    return None if frame is None else int(frame[0, 0, 0])
+
+
+@pytest.fixture
+def stream(monkeypatch: pytest.MonkeyPatch) -> _FakeStream:
+    fake = _FakeStream()
+    monkeypatch.setattr(camera_client.cv2, "VideoCapture", fake.open)
+    # The reader sets default demuxer options in the environment; keep them out of other tests.
+    monkeypatch.delenv("OPENCV_FFMPEG_CAPTURE_OPTIONS", raising=False)
+    return fake
+
+
+@pytest.fixture
+def reader(stream: _FakeStream) -> Iterator[FfmpegSnapshotCameraReader]:
+    camera = FfmpegSnapshotCameraReader(rtsp_url="rtsp://camera/stream1", timeout_s=0.2)
+    yield camera
+    camera.close()
+
+
+def test_capture_analyses_the_newest_decoded_frame(stream: _FakeStream, reader: FfmpegSnapshotCameraReader) -> None:
+    stream.items.put(_frame(40))
+    stream.items.put(_frame(200))
+    _wait_for(lambda: _front_level(reader) == 200)
+
+    measurement = reader.capture_measurement()
+
+    assert measurement.lux == pytest.approx(200.0)
+
+
+def test_reconnect_clears_the_first_frame(stream: _FakeStream, reader: FfmpegSnapshotCameraReader) -> None:
+    stream.items.put(_frame(120))
+    _wait_for(reader._first_frame.is_set)
+
+    stream.items.put(_DROP)
+    _wait_for(lambda: len(stream.captures) == 2)
+
+    assert stream.captures[0].released
+    # A frame from before the outage must not be served as current.
+    with pytest.raises(RuntimeError, match="No frame received"):
+        reader.capture_measurement()
+
+    stream.items.put(_frame(60))
+    _wait_for(reader._first_frame.is_set)
+    assert reader.capture_measurement().lux == pytest.approx(60.0)
+
+
+def test_pump_decodes_into_the_back_buffer_and_swaps(
+    stream: _FakeStream, reader: FfmpegSnapshotCameraReader
+) -> None:
+    buffers: set[int] = set()
+    for level in (10, 20, 30, 40):
+        stream.items.put(_frame(level))
+        _wait_for(lambda: _front_level(reader) == level)
+        if level == 20:
+            buffers = {id(frame) for frame in reader._frames}
+
+    # Once both buffers exist, frames are decoded in place instead of reallocated.
+    assert {id(frame) for frame in reader._frames} == buffers
+    # The previous frame survives in the back buffer: the front one was never written.
+    back = reader._frames[1 - reader._front]
+    assert back is not None and int(back[0, 0, 0]) == 30
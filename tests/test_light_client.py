@@ -0,0 +1,183 @@
+"""Tests for TuyaBulbController against a fake tinytuya module."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import types
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from ledlight_controller.light_client import TuyaBulbController
+from ledlight_controller.models import ColorRGB, LampColorCommand
+
+_ERROR_PAYLOAD = {"Err": "905", "Error": "Network Error: Device Unreachable"}
+
+
+class _FakeBulb:
+    """Stands in for ``tinytuya.BulbDevice``, recording every call made on it."""
+
+    def __init__(self, device_id: str, address: str, local_key: str) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+        # Calls answered with tinytuya's error payload instead of a status.
+        self.failing: set[str] = set()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def call(*args: Any) -> Any:
+            self.calls.append((name, args))
+            return _ERROR_PAYLOAD if name in self.failing else {"dps": {}}
+
+        return call
+
+
+@pytest.fixture
+def bulbs(monkeypatch: pytest.MonkeyPatch) -> list[_FakeBulb]:
+    """Install a fake tinytuya and return every bulb device it builds, in order."""
+    created: list[_FakeBulb] = []
+
+    def build(*args: str) -> _FakeBulb:
+        bulb = _FakeBulb(*args)
+        created.append(bulb)
+        return bulb
+
+    monkeypatch.setitem(sys.modules, "tinytuya", types.SimpleNamespace(BulbDevice=build))
+    return created
+
+
+def _build_controller(**kwargs: Any) -> TuyaBulbController:
+    """Build a controller and wait until its keepalive thread has made the first probe."""
+    # The keepalive never heartbeats on its own here; tests drive heartbeats directly.
+    lamp = TuyaBulbController(device_id="bulb", address="192.0.2.1", local_key="key", heartbeat_s=3600.0, **kwargs)
+    deadline = time.monotonic() + 5.0
+    while not any(name == "status" for name, _ in lamp._device.calls) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The probe runs under the lock, so it has finished once the lock is free.
+    with lamp._lock:
+        pass
+    return lamp
+
+
+@pytest.fixture
+def controller(bulbs: list[_FakeBulb]) -> Iterator[TuyaBulbController]:
+    lamp = _build_controller()
+    yield lamp
+    lamp.close()
+
+
+def _command(red: int, green: int, blue: int, brightness: int = 255) -> LampColorCommand:
+    return LampColorCommand(color=ColorRGB(red, green, blue), brightness=brightness, saturation=255)
+
+
+def _writes(bulb: _FakeBulb) -> list[str]:
+    return [name for name, _ in bulb.calls if name in ("turn_on", "set_mode", "set_colour")]
+
+
+def _colours(bulb: _FakeBulb) -> list[tuple[Any, ...]]:
+    return [args for name, args in bulb.calls if name == "set_colour"]
+
+
+def test_rejected_write_raises_and_is_resent_in_full(
+    controller: TuyaBulbController, bulbs: list[_FakeBulb]
+) -> None:
+    bulb = bulbs[0]
+    bulb.failing.add("set_colour")
+
+    with pytest.raises(RuntimeError, match="set_colour"):
+        controller.apply_state(_command(200, 100, 50))
+
+    bulb.failing.clear()
+    bulb.calls.clear()
+    controller.apply_state(_command(200, 100, 50))
+
+    assert _writes(bulb) == ["turn_on", "set_mode", "set_colour"]
+
+
+def test_every_colour_change_is_sent_by_default(controller: TuyaBulbController, bulbs: list[_FakeBulb]) -> None:
+    controller.apply_state(_command(100, 100, 100))
+    controller.apply_state(_command(101, 100, 100))
+
+    assert _colours(bulbs[0]) == [(100, 100, 100), (101, 100, 100)]
+
+
+def test_debounce_compares_only_the_transmitted_rgb(bulbs: list[_FakeBulb]) -> None:
+    lamp = _build_controller(min_color_delta=6)
+    try:
+        lamp.apply_state(_command(100, 100, 100, brightness=255))
+        # Brightness is not sent, so a large brightness jump alone does not get through.
+        lamp.apply_state(_command(102, 102, 101, brightness=10))
+        lamp.apply_state(_command(103, 102, 102, brightness=10))
+    finally:
+        lamp.close()
+
+    assert _colours(bulbs[0]) == [(100, 100, 100), (103, 102, 102)]
+
+
+def test_construction_does_not_wait_for_the_probe(bulbs: list[_FakeBulb], monkeypatch: pytest.MonkeyPatch) -> None:
+    released = threading.Event()
+
+    def slow_status(self: _FakeBulb) -> Any:
+        self.calls.append(("status", ()))
+        released.wait(5.0)
+        return {"dps": {}}
+
+    monkeypatch.setattr(_FakeBulb, "status", slow_status, raising=False)
+    started = time.monotonic()
+    lamp = TuyaBulbController(device_id="bulb", address="192.0.2.1", local_key="key", heartbeat_s=3600.0)
+    elapsed = time.monotonic() - started
+    released.set()
+    lamp.close()
+
+    assert elapsed < 1.0
+
+
+def test_failed_probe_is_retried_before_the_next_write(
+    bulbs: list[_FakeBulb], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bulb_online = threading.Event()
+
+    def status(self: _FakeBulb) -> Any:
+        self.calls.append(("status", ()))
+        return {"dps": {}} if bulb_online.is_set() else _ERROR_PAYLOAD
+
+    monkeypatch.setattr(_FakeBulb, "status", status, raising=False)
+    lamp = _build_controller()
+    bulb = bulbs[0]
+    try:
+        bulb_online.set()
+        bulb.calls.clear()
+        lamp.apply_state(_command(40, 50, 60))
+        lamp.apply_state(_command(70, 80, 90))
+    finally:
+        lamp.close()
+
+    names = [name for name, _ in bulb.calls]
+    assert names.count("status") == 1
+    assert names.index("status") < names.index("set_colour")
+
+
+def test_failed_heartbeat_rebuilds_the_device_and_resends_everything(
+    controller: TuyaBulbController, bulbs: list[_FakeBulb]
+) -> None:
+    controller.apply_state(_command(200, 100, 50))
+    bulbs[0].failing.add("heartbeat")
+
+    controller._heartbeat()
+
+    assert len(bulbs) == 2
+    assert ("close", ()) in bulbs[0].calls
+    assert [name for name, _ in bulbs[1].calls if name == "status"] == ["status"]
+    controller.apply_state(_command(200, 100, 50))
+    assert _writes(bulbs[1]) == ["turn_on", "set_mode", "set_colour"]
+
+
+def test_healthy_heartbeat_reasserts_turn_on(controller: TuyaBulbController, bulbs: list[_FakeBulb]) -> None:
+    controller.apply_state(_command(200, 100, 50))
+    bulbs[0].calls.clear()
+
+    controller._heartbeat()
+
+    assert [name for name, _ in bulbs[0].calls] == ["heartbeat", "turn_on"]
@@ -0,0 +1,113 @@
+"""Tests for the integer daylight-to-lamp mapping."""
+from __future__ import annotations
+
+import random
+
+from ledlight_controller.models import ColorRGB, LampColorCommand, LightMeasurement
+from ledlight_controller.pipeline import DefaultColorMapper, MapperConfig
+
+# The integer mapper rounds the brightness and the blended color before scaling the
+# color by the brightness, so each output may sit one step from the float result.
+TOLERANCE_LSB = 1
+
+
+def _clamp_round(value: float) -> int:
+    return int(round(max(0.0, min(255.0, value))))
+
+
+def _float_reference(config: MapperConfig, measurement: LightMeasurement) -> LampColorCommand:
+    """Map *measurement* in floating point, rounding only the final values."""
+    lux = measurement.lux
+    if lux is None and measurement.normalized is not None:
+        lux = measurement.normalized * config.bright_lux
+    if lux is None:
+        lux = config.dark_lux
+    normalized = (lux - config.dark_lux) / max(config.bright_lux - config.dark_lux, 1e-6)
+    normalized = max(0.0, min(1.0, normalized))
+    # The mapper defines the daylight level in 8-bit steps; only the arithmetic
+    # downstream of that is compared here.
+    level = int(normalized * 255.0 + 0.5) / 255.0
+
+    if normalized <= 0.0:
+        color = source = config.dark_color
+        brightness = max(config.min_brightness, config.dark_brightness)
+    else:
+        brightness = config.min_brightness + (config.max_brightness - config.min_brightness) * level
+        if config.use_camera_average and measurement.average_color is not None:
+            source = measurement.average_color
+        else:
+            warm, cool = config.warm_color, config.cool_color
+            source = ColorRGB(
+                *(
+                    _clamp_round(a + (b - a) * level)
+                    for a, b in zip((warm.red, warm.green, warm.blue), (cool.red, cool.green, cool.blue))
+                )
+            )
+        scale = brightness / 255.0
+        color = ColorRGB(
+            _clamp_round(source.red * scale),
+            _clamp_round(source.green * scale),
+            _clamp_round(source.blue * scale),
+        )
+
+    sat_source = measurement.average_color if measurement.average_color is not None else source
+    channel_max = max(sat_source.red, sat_source.green, sat_source.blue)
+    channel_min = min(sat_source.red, sat_source.green, sat_source.blue)
+    saturation = 0.0 if channel_max == 0 else (channel_max - channel_min) / channel_max * 255.0
+    saturation = max(config.min_saturation, min(config.max_saturation, saturation))
+    return LampColorCommand(color=color, brightness=_clamp_round(brightness), saturation=_clamp_round(saturation))
+
+
+def _max_difference(a: LampColorCommand, b: LampColorCommand) -> int:
+    return max(
+        abs(a.color.red - b.color.red),
+        abs(a.color.green - b.color.green),
+        abs(a.color.blue - b.color.blue),
+        abs(a.brightness - b.brightness),
+        abs(a.saturation - b.saturation),
+    )
+
+
+def _random_color(rng: random.Random) -> ColorRGB:
+    return ColorRGB(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
+
+
+def test_map_measurement_stays_within_tolerance_of_float_reference() -> None:
+    rng = random.Random(1)
+    worst = 0
+    for _ in range(200):
+        min_brightness = rng.uniform(0.0, 255.0)
+        config = MapperConfig(
+            warm_color=_random_color(rng),
+            cool_color=_random_color(rng),
+            min_brightness=min_brightness,
+            max_brightness=rng.uniform(min_brightness, 400.0),
+            dark_lux=rng.uniform(0.0, 50.0),
+            bright_lux=rng.uniform(60.0, 300.0),
+            use_camera_average=rng.random() < 0.5,
+            min_saturation=rng.uniform(0.0, 255.0),
+            max_saturation=rng.uniform(0.0, 255.0),
+            dark_color=_random_color(rng),
+            dark_brightness=rng.uniform(0.0, 255.0),
+        )
+        mapper = DefaultColorMapper(config)
+        for _ in range(100):
+            measurement = LightMeasurement(
+                lux=rng.choice([None, rng.uniform(-10.0, 300.0)]),
+                normalized=rng.choice([None, rng.random()]),
+                average_color=rng.choice([None, _random_color(rng)]),
+            )
+            difference = _max_difference(mapper.map_measurement(measurement), _float_reference(config, measurement))
+            assert difference <= TOLERANCE_LSB, (config, measurement)
+            worst = max(worst, difference)
+    assert worst > 0  # the comparison exercises the quantised paths
+
+
+def test_brightness_above_255_still_scales_the_color() -> None:
+    config = MapperConfig(max_brightness=400.0, use_camera_average=True)
+    measurement = LightMeasurement(lux=255.0, average_color=ColorRGB(100, 50, 25))
+
+    command = DefaultColorMapper(config).map_measurement(measurement)
+
+    assert command.color == ColorRGB(157, 78, 39)
+    assert command.brightness == 255
@@ -0,0 +1,102 @@
+"""Tests for the capture/lamp hand-off in DaylightSyncService."""
+from __future__ import annotations
+
+import logging
+import queue
+
+import pytest
+
+from ledlight_controller import service
+from ledlight_controller.camera_client import CameraReader
+from ledlight_controller.config import AppConfig, CameraConfig, LampConfig, MapperSettings
+from ledlight_controller.light_client import LampController
+from ledlight_controller.models import ColorRGB, LampColorCommand, LightMeasurement
+from ledlight_controller.service import DaylightSyncService, _offer_latest
+
+
+def _command(level: int) -> LampColorCommand:
+    return LampColorCommand(color=ColorRGB(level, level, level), brightness=level, saturation=0)
+
+
+class _CountingCamera(CameraReader):
+    def __init__(self) -> None:
+        self.captures = 0
+        self.closed = False
+
+    def capture_measurement(self) -> LightMeasurement:
+        self.captures += 1
+        return LightMeasurement(lux=float(self.captures))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _LuxMapper:
+    def map_measurement(self, measurement: LightMeasurement) -> LampColorCommand:
+        return _command(int(measurement.lux))
+
+
+class _RecordingLamp(LampController):
+    def __init__(self) -> None:
+        self.applied: list[LampColorCommand] = []
+        self.closed = False
+
+    def apply_state(self, command: LampColorCommand) -> None:
+        self.applied.append(command)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _build_service(stop_condition: service.StopCondition) -> tuple[DaylightSyncService, _CountingCamera, _RecordingLamp]:
+    camera = _CountingCamera()
+    lamp = _RecordingLamp()
+    config = AppConfig(camera=CameraConfig(), lamp=LampConfig(), mapper=MapperSettings(), capture_interval_s=0.0)
+    sync = DaylightSyncService(camera=camera, lamp=lamp, mapper=_LuxMapper(), config=config, stop_condition=stop_condition)
+    return sync, camera, lamp
+
+
+@pytest.fixture(autouse=True)
+def _fast_queue_poll(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(service, "_QUEUE_POLL_S", 0.01)
+
+
+def test_offer_latest_replaces_the_unsent_command() -> None:
+    pending: queue.Queue[LampColorCommand] = queue.Queue(maxsize=1)
+
+    _offer_latest(pending, _command(1))
+    _offer_latest(pending, _command(2))
+
+    assert pending.get_nowait() == _command(2)
+    assert pending.empty()
+
+
+def test_stop_condition_ends_run_after_the_last_command() -> None:
+    remaining = [3]
+
+    def stop() -> bool:
+        remaining[0] -= 1
+        return remaining[0] < 0
+
+    sync, camera, lamp = _build_service(stop)
+    sync.run()
+
+    assert camera.captures == 3
+    # Older commands may be replaced while the lamp is busy, but never the last one.
+    assert lamp.applied[-1] == _command(3)
+    assert camera.closed
+    assert lamp.closed
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_capture_thread_crash_is_reported(caplog: pytest.LogCaptureFixture) -> None:
+    def stop() -> bool:
+        raise RuntimeError("stop condition broke")
+
+    sync, _, lamp = _build_service(stop)
+    with caplog.at_level(logging.ERROR, logger=service.__name__):
+        sync.run()
+
+    assert "Capture thread exited unexpectedly" in caplog.text
+    assert lamp.applied == []
+    assert lamp.closed
@@ -0,0 +1,41 @@
+"""Tests for the cached TOML settings loader."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ledlight_controller import settings_loader
+from ledlight_controller.settings_loader import SettingsError, load_settings
+
+
+def test_transient_read_error_is_not_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "settings.toml"
+    path.write_text('[lamp]\naddress = "192.0.2.1"\n')
+
+    def unreadable(*args: Any, **kwargs: Any) -> Any:
+        raise PermissionError("settings.toml is locked")
+
+    monkeypatch.setattr(settings_loader, "open", unreadable, raising=False)
+    assert load_settings(path) == {}
+
+    monkeypatch.delattr(settings_loader, "open")
+    assert load_settings(path) == {"lamp": {"address": "192.0.2.1"}}
+
+
+def test_callers_get_their_own_copy(tmp_path: Path) -> None:
+    path = tmp_path / "settings.toml"
+    path.write_text('[lamp]\nversion = "3.3"\n')
+
+    load_settings(path)["lamp"]["version"] = "3.5"
+
+    assert load_settings(path) == {"lamp": {"version": "3.3"}}
+
+
+def test_invalid_toml_raises_settings_error(tmp_path: Path) -> None:
+    path = tmp_path / "settings.toml"
+    path.write_text("[lamp]\naddress = 192.168.1.5\n")
+
+    with pytest.raises(SettingsError, match="line 2"):
+        load_settings(path)